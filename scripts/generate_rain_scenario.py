@@ -1,8 +1,7 @@
 import os
 import csv
+import bisect
 import xml.etree.ElementTree as ET
-from datetime import datetime, timedelta
-import random
 
 # ==============================================================
 # UPDATE THESE PATHS TO MATCH YOUR PROJECT STRUCTURE
@@ -13,7 +12,7 @@ BASELINE_SCENARIO = os.path.join(PROJECT_ROOT, "scenarios", "baseline")
 RAIN_SCENARIO = os.path.join(PROJECT_ROOT, "scenarios", "rain")
 HISTORICAL_RAIN_DATA = os.path.join(DATA_DIR, "weather", "historical_rain_data.csv")
 
-# Rain intensity thresholds
+# Per-intensity pedestrian and vehicle adjustments, ordered from lightest to heaviest
 RAIN_INTENSITY = {
     "none": {"ped_duration": 30, "veh_speed": 13.89},
     "light": {"ped_duration": 45, "veh_speed": 10.0},
@@ -21,15 +20,13 @@ RAIN_INTENSITY = {
     "heavy": {"ped_duration": 90, "veh_speed": 5.0}
 }
 
+# Lower bounds (mm/h) of every intensity level after "none"
+RAIN_THRESHOLDS = (0.1, 5.0, 15.0)
+RAIN_LEVELS = tuple(RAIN_INTENSITY)
+assert len(RAIN_LEVELS) == len(RAIN_THRESHOLDS) + 1, "Each RAIN_INTENSITY level after 'none' needs a threshold"
+
 def get_rain_intensity(rainfall):
-    if rainfall < 0.1:
-        return "none"
-    elif 0.1 <= rainfall < 5.0:
-        return "light"
-    elif 5.0 <= rainfall < 15.0:
-        return "moderate"
-    else:
-        return "heavy"
+    return RAIN_LEVELS[bisect.bisect_right(RAIN_THRESHOLDS, rainfall)]
 
 def generate_rain_scenario_routes():
     # Check if paths exist